@@ -12,44 +12,17 @@ public static class Faker
             fileStream = new FileStream(fitFilePath, FileMode.Open, FileAccess.ReadWrite);
             Console.WriteLine($"Opening {fileStream.Name}");
 
-            var decoder = new Decode();
-            var fitListener = new FitListener();
-            decoder.MesgEvent += fitListener.OnMesg;
-            if (!decoder.IsFIT(fileStream))
+            var fitMessages = ReadMesgs(fileStream, fileStream.Name);
+            if (fitMessages == null)
             {
-                Console.WriteLine($"{fileStream.Name} is not a valid FIT file.");
                 return false;
             }
 
-            if (!decoder.Read(fileStream))
-            {
-                Console.WriteLine($"There was a problem decoding {fileStream.Name}.");
-                return false;
-            }
-
-            foreach (var fileId in fitListener.FitMessages.FileIdMesgs)
-            {
-                fileId.SetManufacturer(Manufacturer.Garmin);
-                fileId.SetProductName("");
-                fileId.SetProduct(GarminProduct.Edge530Apac);
-                fileId.SetGarminProduct(GarminProduct.Edge530Apac);
-            }
-            foreach (var deviceInfo in fitListener.FitMessages.DeviceInfoMesgs)
-            {
-                deviceInfo.SetManufacturer(Manufacturer.Garmin);
-                deviceInfo.SetProductName("");
-                deviceInfo.SetProduct(GarminProduct.Edge530Apac);
-                deviceInfo.SetGarminProduct(GarminProduct.Edge530Apac);
-                deviceInfo.SetSoftwareVersion(9.8f);
-            }
+            FakeMesgs(fitMessages);
 
             fileStream.Position = 0;
             fileStream.SetLength(0); // Clear the file before writing new data
-            var encoder = new Encode(ProtocolVersion.V20);
-            encoder.Open(fileStream);
-            WriteMesgs(encoder, fitListener.FitMessages);
-
-            encoder.Close();
+            EncodeMesgs(fileStream, fitMessages);
             Console.WriteLine($"Successfully wrote to {fileStream.Name}");
 
             return true;
@@ -69,6 +42,78 @@ public static class Faker
         }
     }
 
+    public static byte[]? FakeBytes(byte[] fitData)
+    {
+        try
+        {
+            using var inputStream = new MemoryStream(fitData, false);
+            var fitMessages = ReadMesgs(inputStream, "FIT data");
+            if (fitMessages == null)
+            {
+                return null;
+            }
+
+            FakeMesgs(fitMessages);
+
+            using var outputStream = new MemoryStream(fitData.Length);
+            EncodeMesgs(outputStream, fitMessages);
+
+            return outputStream.ToArray();
+        }
+        catch (Exception ex)
+        {
+            Console.WriteLine($"Exception: {ex.Message}");
+            return null;
+        }
+    }
+
+    private static FitMessages? ReadMesgs(Stream stream, string name)
+    {
+        var decoder = new Decode();
+        var fitListener = new FitListener();
+        decoder.MesgEvent += fitListener.OnMesg;
+        if (!decoder.IsFIT(stream))
+        {
+            Console.WriteLine($"{name} is not a valid FIT file.");
+            return null;
+        }
+
+        if (!decoder.Read(stream))
+        {
+            Console.WriteLine($"There was a problem decoding {name}.");
+            return null;
+        }
+
+        return fitListener.FitMessages;
+    }
+
+    private static void FakeMesgs(FitMessages messages)
+    {
+        foreach (var fileId in messages.FileIdMesgs)
+        {
+            fileId.SetManufacturer(Manufacturer.Garmin);
+            fileId.SetProductName("");
+            fileId.SetProduct(GarminProduct.Edge530Apac);
+            fileId.SetGarminProduct(GarminProduct.Edge530Apac);
+        }
+        foreach (var deviceInfo in messages.DeviceInfoMesgs)
+        {
+            deviceInfo.SetManufacturer(Manufacturer.Garmin);
+            deviceInfo.SetProductName("");
+            deviceInfo.SetProduct(GarminProduct.Edge530Apac);
+            deviceInfo.SetGarminProduct(GarminProduct.Edge530Apac);
+            deviceInfo.SetSoftwareVersion(9.8f);
+        }
+    }
+
+    private static void EncodeMesgs(Stream stream, FitMessages messages)
+    {
+        var encoder = new Encode(ProtocolVersion.V20);
+        encoder.Open(stream);
+        WriteMesgs(encoder, messages);
+        encoder.Close();
+    }
+
     private static void WriteMesgs(Encode encoder, FitMessages messages)
     {
         // FileId (must be first)
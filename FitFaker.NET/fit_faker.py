@@ -8,7 +8,6 @@ for modifying FIT files using the official Garmin FIT SDK.
 
 import sys
 import os
-import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -17,6 +16,7 @@ os.environ["PYTHONNET_RUNTIME"] = "coreclr"
 
 try:
     import clr
+    from System import Array, Byte
 except ImportError:
     print("Error: pythonnet is not installed. Please install it with: pip install pythonnet")
     sys.exit(1)
@@ -49,19 +49,12 @@ class FitFaker:
         Returns:
             Optional[bytes]: Modified FIT file content as bytes, or None if failed
         """
-        # Create temporary file for input
-        with tempfile.NamedTemporaryFile(suffix='.fit', delete=False) as temp_input:
-            temp_input.write(fit_data)
-            temp_input_path = temp_input.name
-
         try:
-            # Call FitFaker.NET to process the temporary file
-            result = self._faker.Fake(temp_input_path)
+            # Call FitFaker.NET to process the data in memory
+            result = self._faker.FakeBytes(Array[Byte](fit_data))
 
-            if result:
-                # Read the modified file back as bytes
-                with open(temp_input_path, 'rb') as f:
-                    modified_data = f.read()
+            if result is not None:
+                modified_data = bytes(result)
                 print(f"Successfully processed FIT file ({len(fit_data)} -> {len(modified_data)} bytes)")
                 return modified_data
             else:
@@ -71,12 +64,6 @@ class FitFaker:
         except Exception as e:
             print(f"Exception occurred while processing FIT file: {e}")
             return None
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(temp_input_path)
-            except OSError:
-                pass
 
     def fake(self, fit_file_path: str) -> bool:
         """
@@ -93,17 +80,8 @@ class FitFaker:
             return False
 
         try:
-            # Read the original file
-            with open(fit_file_path, 'rb') as f:
-                original_data = f.read()
-
-            # Process using bytes method
-            modified_data = self.fake_from_bytes(original_data)
-
-            if modified_data is not None:
-                # Write the modified data back to the original file
-                with open(fit_file_path, 'wb') as f:
-                    f.write(modified_data)
+            # FitFaker.NET rewrites the file in place
+            if self._faker.Fake(fit_file_path):
                 print(f"Successfully processed FIT file: {fit_file_path}")
                 return True
             else:
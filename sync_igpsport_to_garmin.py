@@ -226,45 +226,51 @@ class GarminClient:
             logger.error("Cannot upload activity: Not authenticated with Garmin")
             return None
 
-        while retries <= self.max_retries:
-            try:
-                if retries > 0:
-                    delay = (self.retry_delay * (2 ** (retries - 1))) + random.uniform(0, 2)
-                    logger.info(f"Retrying upload (attempt {retries}/{self.max_retries}) after {delay:.2f}s delay...")
-                    time.sleep(delay)
-
-                with tempfile.NamedTemporaryFile(suffix=".fit", delete=False) as temp_file:
-                    temp_file.write(fit_data)
-                    temp_file_path = temp_file.name
+        # Write the FIT data once and reuse the same file across retries
+        with tempfile.NamedTemporaryFile(suffix=".fit", delete=False) as temp_file:
+            temp_file.write(fit_data)
+            temp_file_path = temp_file.name
 
-                self.garmin.upload_activity(temp_file_path)
+        try:
+            while retries <= self.max_retries:
+                try:
+                    if retries > 0:
+                        delay = (self.retry_delay * (2 ** (retries - 1))) + random.uniform(0, 2)
+                        logger.info(f"Retrying upload (attempt {retries}/{self.max_retries}) after {delay:.2f}s delay...")
+                        time.sleep(delay)
+
+                    self.garmin.upload_activity(temp_file_path)
+
+                    logger.info(f"Successfully uploaded activity to Garmin Connect: {activity_name or 'Unknown Activity'}")
+                    return True
+
+                except Exception as e:
+                    last_error = e
+                    retries += 1
+                    logger.warning(f"Upload attempt {retries} failed with error: {activity_name or 'Unknown Activity'}, {len(fit_data)} bytes, {e}")
+
+                    # Only re-authenticate when specifically needed
+                    if "authentication" in str(e).lower() or "unauthorized" in str(e).lower() or "expired" in str(e).lower():
+                        logger.info("Authentication issue detected. Attempting to re-authenticate...")
+                        try:
+                            self.authenticate(force=True)
+                        except Exception as auth_err:
+                            logger.error(f"Re-authentication failed: {auth_err}")
+
+                    # Rate limiting detection - longer backoff
+                    if "rate" in str(e).lower() or "too many" in str(e).lower():
+                        extra_delay = 30 + random.uniform(0, 10)
+                        logger.warning(f"Rate limiting detected. Adding extra delay of {extra_delay:.2f}s...")
+                        time.sleep(extra_delay)
+
+                    if retries > self.max_retries:
+                        logger.error(f"Failed to upload after {self.max_retries} attempts. Last error: {last_error}")
+                        return None
+        finally:
+            try:
                 os.unlink(temp_file_path)
-
-                logger.info(f"Successfully uploaded activity to Garmin Connect: {activity_name or 'Unknown Activity'}")
-                return True
-
-            except Exception as e:
-                last_error = e
-                retries += 1
-                logger.warning(f"Upload attempt {retries} failed with error: {activity_name or 'Unknown Activity'}, {len(fit_data)} bytes, {e}")
-
-                # Only re-authenticate when specifically needed
-                if "authentication" in str(e).lower() or "unauthorized" in str(e).lower() or "expired" in str(e).lower():
-                    logger.info("Authentication issue detected. Attempting to re-authenticate...")
-                    try:
-                        self.authenticate(force=True)
-                    except Exception as auth_err:
-                        logger.error(f"Re-authentication failed: {auth_err}")
-
-                # Rate limiting detection - longer backoff
-                if "rate" in str(e).lower() or "too many" in str(e).lower():
-                    extra_delay = 30 + random.uniform(0, 10)
-                    logger.warning(f"Rate limiting detected. Adding extra delay of {extra_delay:.2f}s...")
-                    time.sleep(extra_delay)
-
-                if retries > self.max_retries:
-                    logger.error(f"Failed to upload after {self.max_retries} attempts. Last error: {last_error}")
-                    return None
+            except OSError:
+                pass
 
         return None
 
@@ -446,6 +452,7 @@ def main():
 
     sync_count = 0
     latest_synced_date = None
+    faker = FitFaker()
 
     # Download and upload activities in a batch
     for activity_info in activities_to_sync:
@@ -461,7 +468,6 @@ def main():
 
         # Convert FIT file
         logger.info(f"Converting FIT file for activity {activity_id} ({len(fit_data)} bytes)")
-        faker = FitFaker()
         converted_fit_data = faker.fake_from_bytes(fit_data)
 
         if not converted_fit_data: